@@ -2,10 +2,10 @@
 
 from __future__ import annotations
 
-import json
 from re import match
 from typing import Any, Dict, Generic, Optional, TypeVar
 
+from flapjacksearch.http.serializer import json_loads
 from flapjacksearch.http.verb import Verb
 
 T = TypeVar("T")
@@ -65,7 +65,7 @@ class ApiResponse(Generic[T]):
 
         if hasattr(klass, "__origin__") and klass.__origin__ is list:
             sub_kls = klass.__args__[0]
-            arr = json.loads(data)
+            arr = json_loads(data)
             return [ApiResponse.deserialize(sub_kls, sub_data) for sub_data in arr]
 
         if isinstance(klass, str):
@@ -90,10 +90,12 @@ class ApiResponse(Generic[T]):
                 return data
         if klass is object:
             if isinstance(data, str):
-                return json.loads(data)
+                return json_loads(data)
             return data
 
         if isinstance(data, str):
+            if hasattr(klass, "from_dict"):
+                return klass.from_dict(json_loads(data))  # pyright: ignore
             return klass.from_json(data)  # pyright: ignore
 
         return klass.from_dict(data)  # pyright: ignore
@@ -2,29 +2,55 @@
 
 import asyncio
 import time
+from random import uniform
 from typing import Awaitable, Callable, Optional, TypeVar
 
 T = TypeVar("T")
 
 
 class Timeout:
-    def __call__(self, retry_count: int = 0) -> int:
+    def __call__(self, retry_count: int = 0) -> float:
         return retry_count
 
     def __init__(self) -> None:
         pass
 
 
-class RetryTimeout(Timeout):
-    def __call__(self, retry_count: int = 0) -> int:
-        return int(min(retry_count * 0.2, 5))
+class ExponentialRetryTimeout(Timeout):
+    """
+    Doubles the delay (in seconds) between each retry starting at `initial`, bounded by `step * retry_count` and by `cap`, with up to `jitter` (ratio of the delay) added at random.
+
+    The first polls happen within milliseconds, later ones ramp up linearly like the previous fixed steps, so the 50 default retries of the wait helpers still span about 3 minutes.
+    """
+
+    def __call__(self, retry_count: int = 0) -> float:
+        delay = min(self.initial * 2**retry_count, self.step * retry_count, self.cap)
+        return delay + uniform(0, delay * self.jitter)
+
+    def __init__(
+        self,
+        initial: float = 0.005,
+        step: float = 0.2,
+        cap: float = 5,
+        jitter: float = 0.1,
+    ) -> None:
+        self.initial = initial
+        self.step = step
+        self.cap = cap
+        self.jitter = jitter
+
+
+class RetryTimeout(ExponentialRetryTimeout):
+    """
+    Default polling interval of the `wait_for_*` helpers, see `ExponentialRetryTimeout`.
+    """
 
 
 async def create_iterable(
     func: Callable[[Optional[T]], Awaitable[T]],
     validate: Callable[[T], bool],
     aggregator: Optional[Callable[[T], None]],
-    timeout: Callable[[], int] = Timeout(),
+    timeout: Callable[[], float] = Timeout(),
     error_validate: Optional[Callable[[T], bool]] = None,
     error_message: Optional[Callable[[T], str]] = None,
 ) -> T:
@@ -56,7 +82,7 @@ def create_iterable_sync(
     func: Callable[[Optional[T]], T],
     validate: Callable[[T], bool],
     aggregator: Optional[Callable[[T], None]],
-    timeout: Callable[[], int] = Timeout(),
+    timeout: Callable[[], float] = Timeout(),
     error_validate: Optional[Callable[[T], bool]] = None,
     error_message: Optional[Callable[[T], str]] = None,
 ) -> T:
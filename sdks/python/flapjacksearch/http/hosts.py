@@ -39,6 +39,9 @@ class HostsCollection:
             shuffle(self._hosts)
             self._hosts = sorted(self._hosts, key=lambda x: x.priority, reverse=True)
 
+    def __len__(self) -> int:
+        return len(self._hosts)
+
     def read(self) -> List[Host]:
         return [host for host in self._hosts if host.accept & CallType.READ]
 
@@ -1,16 +1,10 @@
 from copy import deepcopy
-from sys import version_info
 from typing import Any, Dict, Optional, Union
 from urllib.parse import quote
 
 from flapjacksearch.http.base_config import BaseConfig
 from flapjacksearch.http.serializer import QueryParametersSerializer
 
-if version_info >= (3, 11):
-    from typing import Self
-else:
-    from typing_extensions import Self
-
 
 class RequestOptions:
     def __init__(
@@ -44,14 +38,14 @@ class RequestOptions:
     def to_json(self) -> str:
         return str(self.__dict__)
 
-    def from_dict(self, data: Dict[str, Dict[str, Any]]) -> Self:
+    def from_dict(self, data: Dict[str, Dict[str, Any]]) -> "RequestOptions":
         return RequestOptions(
             config=self._config,
             headers=data.get("headers", {}),
             query_parameters=data.get("query_parameters", {}),
             timeouts=data.get("timeouts", {}),
             data=data.get("data", {}),
-        )  # pyright: ignore
+        )
 
     def merge(
         self,
@@ -59,8 +53,8 @@ class RequestOptions:
         headers: Optional[Dict[str, str]] = None,
         data: Optional[str] = None,
         timeouts: Dict[str, int] = {},
-        user_request_options: Optional[Union[Self, Dict[str, Any]]] = None,
-    ) -> Self:
+        user_request_options: Optional[Union["RequestOptions", Dict[str, Any]]] = None,
+    ) -> "RequestOptions":
         """
         Merges the default config values with the user given request options if it exists.
         """
@@ -68,8 +62,9 @@ class RequestOptions:
         if query_parameters is None:
             query_parameters = {}
         if headers is None:
-            headers = {}
-        headers.update(self._config.headers)
+            headers = dict(self._config.headers)
+        else:
+            headers.update(self._config.headers)
 
         request_options = {
             "headers": headers,
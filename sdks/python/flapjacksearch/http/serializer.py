@@ -1,11 +1,24 @@
 from decimal import Decimal
-from json import dumps
+from json import dumps, loads
 from typing import Any, Dict, Optional
 from urllib.parse import urlencode
 
+try:
+    from pydantic_core import from_json
+except ImportError:
+    # pydantic-core only ships `from_json` with pydantic >= 2.5
+    from_json = None
+
 PRIMITIVE_TYPES = (float, bool, bytes, str, int)
 
 
+def json_loads(data: str) -> Any:
+    """Parses the given JSON document, using `pydantic_core` when it is available."""
+    if from_json is not None:
+        return from_json(data)
+    return loads(data)
+
+
 class QueryParametersSerializer:
     """
     Parses the given 'query_parameters' values of each keys into their string value.
@@ -1,15 +1,9 @@
 from json import loads
-from sys import version_info
+from threading import Lock
+from typing import List, Optional
 
 from requests import Request, Session, Timeout
-
-if version_info >= (3, 11):
-    from typing import List, Optional, Self
-else:
-    from typing_extensions import List, Self
-
 from requests.adapters import HTTPAdapter
-from urllib3.util import Retry
 
 from flapjacksearch.http.api_response import ApiResponse
 from flapjacksearch.http.base_config import BaseConfig
@@ -28,15 +22,16 @@ class TransporterSync(BaseTransporter):
     def __init__(self, config: BaseConfig) -> None:
         super().__init__(config)
         self._session: Optional[Session] = None
+        self._lock = Lock()
         self._config = config
         self._retry_strategy = RetryStrategy()
         self._hosts: List[Host] = []
 
-    def __enter__(self) -> Self:
+    def __enter__(self) -> "TransporterSync":
         return self
 
     def __exit__(self, exc_type, exc_value, traceback) -> None:
-        pass
+        self.close()
 
     def close(self) -> None:
         if self._session is not None:
@@ -45,6 +40,25 @@ class TransporterSync(BaseTransporter):
 
             _session.close()
 
+    def _create_session(self) -> Session:
+        """
+        Creates the session shared by every request of the transporter, so connections are kept alive between calls.
+        """
+        num_hosts = len(self._config.hosts) if self._config.hosts is not None else 1
+
+        session = Session()
+        for scheme in ("http://", "https://"):
+            session.mount(
+                scheme,
+                HTTPAdapter(
+                    pool_connections=max(4, num_hosts),
+                    pool_maxsize=max(32, 4 * num_hosts),
+                    max_retries=0,
+                ),
+            )
+
+        return session
+
     def request(
         self,
         verb: Verb,
@@ -52,17 +66,21 @@ class TransporterSync(BaseTransporter):
         request_options: RequestOptions,
         use_read_transporter: bool,
     ) -> ApiResponse:
-        if self._session is None:
-            self._session = Session()
-            self._session.mount("https://", HTTPAdapter(max_retries=Retry(connect=0)))
-
-        query_parameters = self.prepare(
-            request_options, verb == Verb.GET or use_read_transporter
-        )
+        # the client can be shared between threads, `prepare` updates the hosts and timeout in place
+        with self._lock:
+            if self._session is None:
+                self._session = self._create_session()
+            session = self._session
+
+            query_parameters = self.prepare(
+                request_options, verb == Verb.GET or use_read_transporter
+            )
+            hosts = self._hosts
+            read_timeout = self._timeout / 1000
 
         path = self.build_path(path, query_parameters)
 
-        for host in self._retry_strategy.valid_hosts(self._hosts):
+        for host in self._retry_strategy.valid_hosts(hosts):
             url = self.build_url(host, path)
             proxies = self.get_proxies(url)
 
@@ -77,9 +95,8 @@ class TransporterSync(BaseTransporter):
                 connect_timeout = (
                     request_options.timeouts["connect"] * (host.retry_count + 1)
                 ) / 1000
-                read_timeout = self._timeout / 1000
 
-                resp = self._session.send(
+                resp = session.send(
                     req,
                     timeout=(connect_timeout, read_timeout),
                     proxies=proxies,
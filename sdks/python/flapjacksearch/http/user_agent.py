@@ -1,28 +1,25 @@
 from platform import python_version
-from sys import version_info
-from typing import Optional
-
-if version_info >= (3, 11):
-    from typing import Self
-else:
-    from typing_extensions import Self
+from sys import intern
+from typing import List, Optional
 
 from flapjacksearch import __version__
 
+# The base segment only depends on the package and interpreter versions, compute it once.
+_BASE_UA = f"Flapjack for Python ({__version__}); Python ({python_version()})"
+
 
 class UserAgent:
     def __init__(self) -> None:
-        self.value = "Flapjack for Python ({}); Python ({})".format(
-            __version__, str(python_version())
-        )
+        self._segments: List[str] = [_BASE_UA]
+        self._cached: Optional[str] = _BASE_UA
 
     def get(self) -> str:
-        return self.value
-
-    def add(self, segment: str, version: Optional[str] = None) -> Self:
-        self.value += "; {}".format(segment)
+        if self._cached is None:
+            self._cached = intern("; ".join(self._segments))
+        return self._cached
 
-        if version is not None:
-            self.value += " ({})".format(version)
+    def add(self, segment: str, version: Optional[str] = None) -> "UserAgent":
+        self._segments.append(segment if version is None else f"{segment} ({version})")
+        self._cached = None
 
         return self
@@ -0,0 +1,78 @@
+# coding: utf-8
+
+from asyncio import gather
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, List, Optional, Union
+
+from flapjacksearch.http.helpers import RetryTimeout
+from flapjacksearch.http.request_options import RequestOptions
+from flapjacksearch.search.client import SearchClient, SearchClientSync
+from flapjacksearch.search.models import GetTaskResponse, SearchForHits
+
+
+async def wait_for_tasks(
+    client: SearchClient,
+    index_name: str,
+    task_ids: List[int],
+    timeout: RetryTimeout = RetryTimeout(),
+    max_retries: int = 50,
+    request_options: Optional[Union[dict, RequestOptions]] = None,
+) -> List[GetTaskResponse]:
+    """
+    Helper: Wait for every task of `task_ids` to be published (completed) for a given `index_name`, polling them concurrently.
+    """
+    return list(
+        await gather(
+            *(
+                client.wait_for_task(
+                    index_name=index_name,
+                    task_id=task_id,
+                    timeout=timeout,
+                    max_retries=max_retries,
+                    request_options=request_options,
+                )
+                for task_id in task_ids
+            )
+        )
+    )
+
+
+def wait_for_tasks_sync(
+    client: SearchClientSync,
+    index_name: str,
+    task_ids: List[int],
+    timeout: RetryTimeout = RetryTimeout(),
+    max_retries: int = 50,
+    request_options: Optional[Union[dict, RequestOptions]] = None,
+) -> List[GetTaskResponse]:
+    """
+    Helper: Wait for every task of `task_ids` to be published (completed) for a given `index_name`, polling them concurrently.
+    """
+    if len(task_ids) == 0:
+        return []
+
+    def _wait(task_id: int) -> GetTaskResponse:
+        return client.wait_for_task(
+            index_name=index_name,
+            task_id=task_id,
+            timeout=timeout,
+            max_retries=max_retries,
+            request_options=request_options,
+        )
+
+    with ThreadPoolExecutor(max_workers=min(len(task_ids), 32)) as executor:
+        return list(executor.map(_wait, task_ids))
+
+
+def trusted_search_for_hits(
+    index_name: str, query: str, **kwargs: Any
+) -> SearchForHits:
+    """
+    Helper: Creates a `SearchForHits` query without running validation.
+
+    Only use it with values that already have the right types, e.g. when building
+    large numbers of queries in benchmarks or internal composition. `kwargs` must use
+    the field names (`hits_per_page`), aliases such as `hitsPerPage` aren't resolved
+    and are kept as extra keys next to the field.
+    """
+    return SearchForHits.model_construct(index_name=index_name, query=query, **kwargs)
@@ -0,0 +1,40 @@
+from flapjacksearch.http.helpers import ExponentialRetryTimeout, RetryTimeout
+
+
+def test_exponential_retry_timeout_sequence():
+    timeout = ExponentialRetryTimeout(jitter=0)
+
+    assert [round(timeout(n), 3) for n in range(1, 11)] == [
+        0.01,
+        0.02,
+        0.04,
+        0.08,
+        0.16,
+        0.32,
+        0.64,
+        1.28,
+        1.8,
+        2.0,
+    ]
+    assert timeout(25) == 5
+    assert timeout(1000) == 5
+
+
+def test_exponential_retry_timeout_total():
+    timeout = ExponentialRetryTimeout(jitter=0)
+
+    # wait_for_task sleeps between its 50 polls with retry counts 1 to 49
+    assert round(sum(timeout(n) for n in range(1, 50)), 2) == 180.35
+
+
+def test_exponential_retry_timeout_jitter():
+    timeout = ExponentialRetryTimeout(jitter=0.1)
+
+    for n in range(1, 50):
+        base = ExponentialRetryTimeout(jitter=0)(n)
+        assert base <= timeout(n) <= base * 1.1
+
+
+def test_retry_timeout_uses_exponential_backoff():
+    assert isinstance(RetryTimeout(), ExponentialRetryTimeout)
+    assert RetryTimeout()(1) < 0.02
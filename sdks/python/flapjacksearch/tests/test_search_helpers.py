@@ -0,0 +1,81 @@
+import asyncio
+import time
+from threading import Barrier
+
+from flapjacksearch.http.serializer import body_serializer
+from flapjacksearch.search.helpers import (
+    trusted_search_for_hits,
+    wait_for_tasks,
+    wait_for_tasks_sync,
+)
+from flapjacksearch.search.models import SearchForHits, SearchMethodParams, SearchQuery
+
+
+class StubClientSync:
+    """answers `wait_for_task` after a delay, later task ids first."""
+
+    def __init__(self, parties: int = 1) -> None:
+        self.barrier = Barrier(parties, timeout=5)
+        self.calls = []
+
+    def wait_for_task(self, index_name, task_id, **kwargs):
+        self.calls.append((index_name, task_id))
+        # every call has to be running at the same time to get past the barrier
+        self.barrier.wait()
+        time.sleep(0.01 / task_id)
+        return task_id
+
+
+class StubClient:
+    """answers `wait_for_task` after a delay, later task ids first."""
+
+    def __init__(self) -> None:
+        self.running = 0
+        self.max_running = 0
+
+    async def wait_for_task(self, index_name, task_id, **kwargs):
+        self.running += 1
+        self.max_running = max(self.max_running, self.running)
+        await asyncio.sleep(0.01 / task_id)
+        self.running -= 1
+        return task_id
+
+
+def test_wait_for_tasks_sync_keeps_order():
+    client = StubClientSync(parties=3)
+
+    assert wait_for_tasks_sync(client, "idx", [1, 2, 3]) == [1, 2, 3]  # type: ignore
+    assert sorted(client.calls) == [("idx", 1), ("idx", 2), ("idx", 3)]
+
+
+def test_wait_for_tasks_sync_empty():
+    client = StubClientSync()
+
+    assert wait_for_tasks_sync(client, "idx", []) == []  # type: ignore
+    assert client.calls == []
+
+
+def test_wait_for_tasks_keeps_order_and_runs_concurrently():
+    client = StubClient()
+
+    results = asyncio.run(wait_for_tasks(client, "idx", [1, 2, 3]))  # type: ignore
+
+    assert results == [1, 2, 3]
+    assert client.max_running == 3
+
+
+def test_wait_for_tasks_empty():
+    client = StubClient()
+
+    assert asyncio.run(wait_for_tasks(client, "idx", [])) == []  # type: ignore
+    assert client.max_running == 0
+
+
+def test_trusted_search_for_hits_matches_validated_model():
+    trusted = trusted_search_for_hits("idx", "q", hits_per_page=2)
+    validated = SearchForHits(index_name="idx", query="q", hits_per_page=2)
+
+    assert trusted.to_dict() == validated.to_dict()
+    assert body_serializer(
+        SearchMethodParams(requests=[SearchQuery(trusted)])
+    ) == body_serializer(SearchMethodParams(requests=[SearchQuery(validated)]))
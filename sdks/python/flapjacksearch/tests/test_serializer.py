@@ -0,0 +1,22 @@
+from flapjacksearch.http.serializer import json_loads
+
+
+def test_json_loads_keeps_large_integers():
+    """integers over 64 bits are parsed exactly, not as floats."""
+    assert json_loads('{"a": 123456789012345678901234}') == {
+        "a": 123456789012345678901234
+    }
+    assert json_loads('{"a": 1, "b": [true, null, "x"]}') == {
+        "a": 1,
+        "b": [True, None, "x"],
+    }
+
+
+def test_json_loads_matches_stdlib():
+    """non-finite numbers and unicode escapes are parsed like the stdlib does."""
+    assert json_loads('[Infinity, -Infinity, 1.5, "\\u00e9"]') == [
+        float("inf"),
+        float("-inf"),
+        1.5,
+        "é",
+    ]
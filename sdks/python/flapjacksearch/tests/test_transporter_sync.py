@@ -0,0 +1,53 @@
+import time
+from concurrent.futures import ThreadPoolExecutor
+from threading import Barrier
+from types import SimpleNamespace
+
+from flapjacksearch.http.base_config import BaseConfig
+from flapjacksearch.http.hosts import CallType, Host, HostsCollection
+from flapjacksearch.http.request_options import RequestOptions
+from flapjacksearch.http.transporter_sync import TransporterSync
+from flapjacksearch.http.verb import Verb
+
+
+class StubSession:
+    def send(self, req, **kwargs):
+        return SimpleNamespace(status_code=200, headers={}, text="{}", reason="OK")
+
+    def close(self) -> None:
+        pass
+
+
+def test_concurrent_first_requests_share_one_session(monkeypatch):
+    """threads racing on the first request of a transporter create a single session."""
+    config = BaseConfig("test-app", "test-key")
+    config.hosts = HostsCollection(
+        [Host("localhost", scheme="http", accept=CallType.READ | CallType.WRITE)]
+    )
+    transporter = TransporterSync(config)
+    request_options = RequestOptions(config).merge()
+
+    sessions = []
+    barrier = Barrier(8, timeout=5)
+
+    def _create_session():
+        # leave the other threads time to reach the session check
+        time.sleep(0.05)
+        sessions.append(StubSession())
+        return sessions[-1]
+
+    monkeypatch.setattr(transporter, "_create_session", _create_session)
+
+    def _request(_):
+        barrier.wait()
+        return transporter.request(
+            verb=Verb.GET,
+            path="/1/task/1",
+            request_options=request_options,
+            use_read_transporter=True,
+        ).status_code
+
+    with ThreadPoolExecutor(max_workers=8) as executor:
+        assert list(executor.map(_request, range(8))) == [200] * 8
+
+    assert len(sessions) == 1
@@ -0,0 +1,45 @@
+from platform import python_version
+
+from flapjacksearch import __version__
+from flapjacksearch.http.base_config import BaseConfig
+from flapjacksearch.http.user_agent import UserAgent
+from flapjacksearch.search.config import SearchConfig
+
+BASE_UA = f"Flapjack for Python ({__version__}); Python ({python_version()})"
+
+
+def test_get_before_and_after_add():
+    user_agent = UserAgent()
+    assert user_agent.get() == BASE_UA
+
+    user_agent.add("TestApp", "1.0.0")
+    assert user_agent.get() == f"{BASE_UA}; TestApp (1.0.0)"
+    # cached until the next add
+    assert user_agent.get() is user_agent.get()
+
+
+def test_add_without_version():
+    assert UserAgent().add("TestApp").get() == f"{BASE_UA}; TestApp"
+
+
+def test_chained_adds():
+    user_agent = UserAgent().add("A", "1").add("B").add("C", "3")
+    assert user_agent.get() == f"{BASE_UA}; A (1); B; C (3)"
+
+    user_agent.add("D")
+    assert user_agent.get() == f"{BASE_UA}; A (1); B; C (3); D"
+
+
+def test_add_user_agent_updates_headers():
+    config = BaseConfig("test-app", "test-key")
+    config.add_user_agent("TestApp", "1.0.0")
+    assert config.headers["user-agent"] == f"{BASE_UA}; TestApp (1.0.0)"
+
+    search_config = SearchConfig("test-app", "test-key")
+    assert search_config.headers["user-agent"] == f"{BASE_UA}; Search ({__version__})"
+
+    search_config.add_user_agent("TestApp")
+    assert (
+        search_config.headers["user-agent"]
+        == f"{BASE_UA}; Search ({__version__}); TestApp"
+    )
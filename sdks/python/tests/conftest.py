@@ -0,0 +1,96 @@
+"""Shared fixtures for the flapjack-search Python SDK e2e tests."""
+
+from uuid import uuid4
+
+import pytest
+
+from flapjacksearch.http.hosts import CallType, Host, HostsCollection
+from flapjacksearch.search.client import SearchClientSync
+from flapjacksearch.search.config import SearchConfig
+from flapjacksearch.search.helpers import wait_for_tasks_sync
+from flapjacksearch.search.models import IndexSettings
+
+
+@pytest.fixture(scope="session")
+def index_name():
+    # Unique per test session so concurrent runs against the same server don't collide.
+    return f"python-e2e-{uuid4().hex[:8]}"
+
+
+@pytest.fixture(scope="session")
+def client(index_name):
+    config = SearchConfig("test-app", "test-api-key")
+    config.hosts = HostsCollection(
+        [
+            Host(
+                url="localhost:7700",
+                scheme="http",
+                accept=CallType.READ | CallType.WRITE,
+            )
+        ]
+    )
+    c = SearchClientSync.create_with_config(config=config)
+    yield c
+    # Cleanup
+    try:
+        c.delete_index(index_name=index_name)
+    except Exception:
+        pass
+    c.close()
+
+
+@pytest.fixture(scope="session", autouse=True)
+def seed_data(client, index_name):
+    """Seed test data once per session and wait for indexing."""
+    objects = [
+        {
+            "objectID": "1",
+            "name": "iPhone 15 Pro",
+            "brand": "Apple",
+            "price": 1199,
+            "category": "phone",
+        },
+        {
+            "objectID": "2",
+            "name": "Galaxy S24 Ultra",
+            "brand": "Samsung",
+            "price": 1299,
+            "category": "phone",
+        },
+        {
+            "objectID": "3",
+            "name": "Pixel 8 Pro",
+            "brand": "Google",
+            "price": 999,
+            "category": "phone",
+        },
+        {
+            "objectID": "4",
+            "name": "MacBook Pro M3",
+            "brand": "Apple",
+            "price": 1999,
+            "category": "laptop",
+        },
+        {
+            "objectID": "5",
+            "name": "ThinkPad X1 Carbon",
+            "brand": "Lenovo",
+            "price": 1499,
+            "category": "laptop",
+        },
+    ]
+    save_results = client.save_objects(index_name=index_name, objects=objects)
+
+    # Set searchable attributes
+    settings_result = client.set_settings(
+        index_name=index_name,
+        index_settings=IndexSettings(
+            searchable_attributes=["name", "brand", "category"],
+            attributes_for_faceting=["brand", "category"],
+        ),
+    )
+    wait_for_tasks_sync(
+        client,
+        index_name=index_name,
+        task_ids=[r.task_id for r in save_results] + [settings_result.task_id],
+    )